@@ -104,7 +104,10 @@ def cli(ctx: click.Context, ssh_user: str, additional_args: List[str], **kwargs)
         proxy.show_message(f"Starting interactive ssh session with {device} ({host})")
 
     logging.info("Starting ssh session using: %s", " ".join(ssh_args))
-    exit_code = subprocess.call(ssh_args, env=os.environ)
+
+    # close_fds=False lets CPython use the faster posix_spawn startup path.
+    # No sensitive file descriptors are inherited by the child.
+    exit_code = subprocess.call(ssh_args, env=os.environ, close_fds=False)
     if exit_code != 0:
         proxy.show_error(f"SSH exited with a non-zero exit code. code={exit_code}")
     ctx.exit(exit_code)
@@ -23,24 +23,23 @@ import os
 import pathlib
 import signal
 import threading
-import time
 import sys
 import socket
 from enum import IntEnum
 from logging.handlers import RotatingFileHandler
-from typing import Any, Dict, NoReturn, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, NoReturn, Optional
 
 import click
 
 from ..timer import CommandTimer
 from ..banner import BANNER1
 from ..env import save_env
-from ..rest_client.c8yclient import CumulocityClient, CumulocityMissingTFAToken
-from ..tcp_socket import TCPProxyServer, StdioProxyServer
-from ..websocket_client import WebsocketClient
 
-if hasattr(socket, "AF_UNIX"):
-    from ..tcp_socket import UnixStreamProxyServer
+# Defer the import of the rest client (requests) and the socket/websocket
+# servers until they are actually used, so commands which never talk to
+# Cumulocity (e.g. version/help) start without paying for those imports
+if TYPE_CHECKING:
+    from ..rest_client.c8yclient import CumulocityClient
 
 
 class ExitCodes(IntEnum):
@@ -70,30 +69,31 @@ class ExitCodes(IntEnum):
 class ProxyContext:
     """Local proxy context"""
 
-    host = ""
-    device = ""
-    external_type = ""
-    config = ""
-    tenant = ""
-    user = ""
-    token = ""
-    password = ""
-    tfa_code = ""
-    port = 0
-    ping_interval = 0
-    kill = False
-    tcp_size = 0
-    tcp_timeout = 0
-    verbose = False
-    ignore_ssl_validate = False
-    ssh_user = ""
-    additional_args = None
-    disable_prompts = False
-    env_file = None
-    store_token = False
-    wait_port_timeout = 60.0
-    socket_path = ""
-    stdio = False
+    host: str = ""
+    device: str = ""
+    external_type: str = ""
+    config: str = ""
+    tenant: str = ""
+    user: str = ""
+    token: str = ""
+    password: str = ""
+    tfa_code: str = ""
+    port: int = 0
+    ping_interval: int = 0
+    kill: bool = False
+    tcp_size: int = 0
+    tcp_timeout: float = 0
+    ws_batch_ms: float = 0
+    verbose: bool = False
+    ignore_ssl_validate: bool = False
+    ssh_user: str = ""
+    additional_args: Optional[List[str]] = None
+    disable_prompts: bool = False
+    env_file: Optional[str] = None
+    store_token: bool = False
+    wait_port_timeout: float = 60.0
+    socket_path: str = ""
+    stdio: bool = False
 
     def __init__(self, ctx: click.Context, src_dict: Dict[str, Any] = None) -> None:
         self._ctx = ctx
@@ -146,12 +146,9 @@ class ProxyContext:
             ProxyContext: Proxy options after the values have been set
                 via the dictionary
         """
-        logging.info("Loading from dictionary")
         assert isinstance(src_dict, dict)
-        for key, value in src_dict.items():
-            logging.info("reading key: %s=%s", key, value)
-            if hasattr(self, key):
-                setattr(self, key, value)
+        for key in src_dict.keys() & _PROXY_FIELDS:
+            setattr(self, key, src_dict[key])
         return self
 
     def start_background(self, ctx: click.Context = None) -> "ProxyContext":
@@ -229,19 +226,31 @@ class ProxyContext:
         """Set environment variables so information about the proxy can
         be access by plugins
         """
-        os.environ["C8Y_HOST"] = str(self.host)
-        os.environ["PORT"] = str(self.used_port)
-        os.environ["DEVICE"] = self.device
+        env = {
+            "C8Y_HOST": str(self.host),
+            "PORT": str(self.used_port),
+            "DEVICE": self.device,
+            # Support WSL environments and expose variables to be explosed to WSL
+            "WSLENV": "PORT/u:DEVICE/u:C8Y_HOST/u",
+        }
 
-        # Support WSL environments and expose variables to be explosed to WSL
-        os.environ["WSLENV"] = "PORT/u:DEVICE/u:C8Y_HOST/u"
+        # Each assignment to os.environ triggers a putenv call, so skip
+        # values which are already up to date (i.e. when called twice)
+        for key, value in env.items():
+            if os.environ.get(key) != value:
+                os.environ[key] = value
+
+
+# Precomputed field names so fromdict can filter unknown keys with a
+# single set intersection instead of a hasattr call per key
+_PROXY_FIELDS = frozenset(field.name for field in dataclasses.fields(ProxyContext))
 
 
 @dataclasses.dataclass
 class RemoteAccessConnectionData:
     """Remote access connection data"""
 
-    client: CumulocityClient
+    client: "CumulocityClient"
     managed_object_id: str
     remote_config_id: str
 
@@ -264,6 +273,40 @@ class CliLogger:
         )
 
 
+class LazyRotatingFileHandler(logging.Handler):
+    """Rotating file handler which defers creating the log directory and
+    opening the log file until the first record is emitted.
+
+    This keeps the filesystem round-trip (mkdir, stat, open) off the
+    start-up path of short-lived commands which never log anything.
+    """
+
+    def __init__(self, filename: str, **kwargs) -> None:
+        super().__init__()
+        self._filename = filename
+        self._kwargs = kwargs
+        self._handler: Optional[RotatingFileHandler] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit a log record, opening the underlying file handler on first use
+
+        Args:
+            record (logging.LogRecord): Log record
+        """
+        if self._handler is None:
+            pathlib.Path(self._filename).parent.mkdir(parents=True, exist_ok=True)
+            self._handler = RotatingFileHandler(filename=self._filename, **self._kwargs)
+            self._handler.setFormatter(self.formatter)
+            self._handler.setLevel(self.level)
+        self._handler.emit(record)
+
+    def close(self) -> None:
+        """Close the underlying file handler (if it was ever opened)"""
+        if self._handler is not None:
+            self._handler.close()
+        super().close()
+
+
 def configure_logger(path: pathlib.Path, verbose: bool = False) -> logging.Logger:
     """Configure logger
 
@@ -274,8 +317,6 @@ def configure_logger(path: pathlib.Path, verbose: bool = False) -> logging.Logge
     Returns:
         logging.Logger: Created logger
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
     log_file_formatter = logging.Formatter(
@@ -303,7 +344,7 @@ def configure_logger(path: pathlib.Path, verbose: bool = False) -> logging.Logge
         logger.handlers = []
 
     # Max 5 log files each 10 MB.
-    rotate_handler = RotatingFileHandler(
+    rotate_handler = LazyRotatingFileHandler(
         filename=str(path), maxBytes=10000000, backupCount=5
     )
     rotate_handler.setFormatter(log_file_formatter)
@@ -314,17 +355,26 @@ def configure_logger(path: pathlib.Path, verbose: bool = False) -> logging.Logge
     return logger
 
 
-def signal_handler(_signal, _frame):
-    """Signal handler"""
-    sys.exit(ExitCodes.TERMINATE)
+def register_signals(stop_signal: threading.Event = None):
+    """Register signal handlers
 
+    Args:
+        stop_signal (threading.Event, optional): Event to set when a signal
+            is received. Setting the event wakes up any thread blocking on
+            it immediately, rather than waiting for the raised SystemExit
+            to surface at the next bytecode boundary.
+    """
+
+    def signal_handler(_signal, _frame):
+        """Signal handler"""
+        if stop_signal is not None:
+            stop_signal.set()
+        sys.exit(ExitCodes.TERMINATE)
 
-def register_signals():
-    """Register signal handlers"""
     signal.signal(signal.SIGINT, signal_handler)
 
 
-def create_client(ctx: click.Context, opts: ProxyContext) -> CumulocityClient:
+def create_client(ctx: click.Context, opts: ProxyContext) -> "CumulocityClient":
     """Create Cumulocity client and prompt for missing credentials
     if necessary.
 
@@ -335,6 +385,9 @@ def create_client(ctx: click.Context, opts: ProxyContext) -> CumulocityClient:
     Returns:
         CumulocityClient: Configured Cumulocity client
     """
+    # pylint: disable=import-outside-toplevel,too-many-branches
+    from ..rest_client.c8yclient import CumulocityClient, CumulocityMissingTFAToken
+
     if not opts.disable_prompts and not opts.host:
         opts.host = click.prompt(
             text="Enter the Cumulocity Host/URL",
@@ -395,6 +448,11 @@ def create_client(ctx: click.Context, opts: ProxyContext) -> CumulocityClient:
                     hide_input=True,
                 )
 
+        # When prompts are disabled there is no new credential material to
+        # try, so retrying would only repeat the same failing request
+        if opts.disable_prompts:
+            break
+
         retries -= 1
 
     if not success:
@@ -404,7 +462,7 @@ def create_client(ctx: click.Context, opts: ProxyContext) -> CumulocityClient:
     return client
 
 
-def store_credentials(opts: ProxyContext, client: CumulocityClient):
+def store_credentials(opts: ProxyContext, client: "CumulocityClient"):
     """Store credentials to the environment file. It creates
     the file if it does not already exist.
 
@@ -444,16 +502,15 @@ def get_config_id(ctx: click.Context, mor: Dict[str, Any], config: str) -> str:
         str: Remote access configuration id
     """
     device_name = mor.get("name", "<<empty_name>>")
-    if REMOTE_ACCESS_FRAGMENT not in mor:
+    remote_configs = mor.get(REMOTE_ACCESS_FRAGMENT)
+    if remote_configs is None:
         logging.error(
             'No Remote Access Configuration has been found for device "%s"', device_name
         )
         ctx.exit(ExitCodes.DEVICE_MISSING_REMOTE_ACCESS_FRAGMENT)
 
     valid_configs = [
-        item
-        for item in mor.get(REMOTE_ACCESS_FRAGMENT, [])
-        if item.get("protocol") == PASSTHROUGH
+        item for item in remote_configs if item.get("protocol") == PASSTHROUGH
     ]
 
     if not valid_configs:
@@ -476,14 +533,18 @@ def get_config_id(ctx: click.Context, mor: Dict[str, Any], config: str) -> str:
         # use first config
         return extract_config_id(valid_configs[0])
 
-    # find config matching name
-    matches = [
-        item
-        for item in valid_configs
-        if item.get("name", "").casefold() == config.casefold()
-    ]
+    # find first config matching name (case insensitive)
+    target_name = config.casefold()
+    match = next(
+        (
+            item
+            for item in valid_configs
+            if (item.get("name") or "").casefold() == target_name
+        ),
+        None,
+    )
 
-    if not matches:
+    if match is None:
         logging.error(
             'Provided config name "%s" for "%s" was not found or none with protocal set to "%s"',
             config,
@@ -492,7 +553,7 @@ def get_config_id(ctx: click.Context, mor: Dict[str, Any], config: str) -> str:
         )
         ctx.exit(ExitCodes.DEVICE_NO_MATCHING_PASSTHROUGH_CONFIG)
 
-    return extract_config_id(matches[0])
+    return extract_config_id(match)
 
 
 def run_proxy_in_background(
@@ -514,7 +575,7 @@ def run_proxy_in_background(
 
     # register signals as the proxy will be starting in a background thread
     # to enable the proxy to run as a subcommand
-    register_signals()
+    register_signals(stop_signal)
 
     # Start the proxy in a background thread so the user can
     background = threading.Thread(
@@ -525,6 +586,7 @@ def run_proxy_in_background(
             stop_signal=stop_signal,
             ready_signal=_local_ready_signal,
         ),
+        name="c8ylp-proxy",
         daemon=True,
     )
     background.start()
@@ -623,10 +685,20 @@ def start_proxy(
         ctx (click.Context): Click context
         opts (ProxyContext): Proxy options
     """
-    # pylint: disable=too-many-branches,too-many-statements
+    # pylint: disable=too-many-branches,too-many-statements,too-many-locals,import-outside-toplevel
+    from ..tcp_socket import TCPProxyServer, StdioProxyServer
+    from ..websocket_client import WebsocketClient
+
+    if hasattr(socket, "AF_UNIX"):
+        from ..tcp_socket import UnixStreamProxyServer
+
     is_main_thread = threading.current_thread() is threading.main_thread()
+
+    if stop_signal is None:
+        stop_signal = threading.Event()
+
     if is_main_thread:
-        register_signals()
+        register_signals(stop_signal)
 
     client_opts = {
         "host": opts.host,
@@ -649,6 +721,7 @@ def start_proxy(
                 WebsocketClient(**client_opts),
                 opts.tcp_size,
                 opts.tcp_timeout,
+                opts.ws_batch_ms,
             )
         elif opts.stdio:
             socket_server = StdioProxyServer(
@@ -661,12 +734,24 @@ def start_proxy(
                 WebsocketClient(**client_opts),
                 opts.tcp_size,
                 opts.tcp_timeout,
+                opts.ws_batch_ms,
             )
 
         click.secho(BANNER1)
         logging.info("Starting socket server")
 
-        background = threading.Thread(target=socket_server.serve_forever, daemon=True)
+        def serve_in_background():
+            # Set the stop signal once the server returns (or dies) so the
+            # foreground thread wakes up immediately instead of only
+            # noticing on its next periodic liveness check
+            try:
+                socket_server.serve_forever()
+            finally:
+                stop_signal.set()
+
+        background = threading.Thread(
+            target=serve_in_background, name="c8ylp-server", daemon=True
+        )
         background.start()
 
         # Block until the local proxy is ready to accept connections
@@ -699,15 +784,18 @@ def start_proxy(
         if ready_signal:
             ready_signal.set()
 
-        # loop, waiting for server to stop
+        # loop, waiting for server to stop. Block on the stop signal so the
+        # thread sleeps in the kernel instead of waking every second; the
+        # server thread sets the signal itself if it dies on its own
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
         while background.is_alive():
-            if stop_signal and stop_signal.is_set():
+            if stop_signal.wait(timeout=60):
                 break
-            time.sleep(1)
-            logging.debug(
-                "Waiting in background: alive=%s",
-                background.is_alive(),
-            )
+            if debug_enabled:
+                logging.debug(
+                    "Waiting in background: alive=%s",
+                    background.is_alive(),
+                )
     except Exception as ex:
         if isinstance(ex, click.exceptions.Exit):
             # propagate exit code
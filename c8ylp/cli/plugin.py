@@ -17,6 +17,7 @@
 #
 """plugin command"""
 
+import functools
 import re
 import os
 import subprocess
@@ -24,13 +25,17 @@ import logging
 import platform
 import shutil
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import click
 
 from c8ylp import __ROOT_DIR__
 from .. import options
 from .core import ExitCodes, ProxyContext
 
+# Cache the platform lookup as it does not change at runtime and
+# build_cmd_args can be called once per plugin invocation
+_IS_WINDOWS = platform.system() == "Windows"
+
 
 def plugin_folders() -> List[Path]:
     """Plugin folders
@@ -52,6 +57,30 @@ def plugin_folders() -> List[Path]:
     return paths
 
 
+@functools.lru_cache(maxsize=None)
+def _scan_plugin_folder(folder: str, _mtime_ns: int) -> Tuple[str, ...]:
+    """Scan a plugin folder for plugin scripts
+
+    The result is memoized per folder modification time, so repeated
+    lookups within a process only list the directory again when its
+    contents have actually changed.
+
+    Args:
+        folder (str): Expanded path to the plugin folder
+        _mtime_ns (int): Modification time of the folder (cache key only)
+
+    Returns:
+        Tuple[str, ...]: Names of the detected plugins (without extension)
+    """
+    cmds = []
+    for filename in os.listdir(folder):
+        if filename.endswith(".py") and filename != "__init__.py":
+            cmds.append(filename[:-3])
+        elif filename.endswith(".sh"):
+            cmds.append(filename[:-3])
+    return tuple(cmds)
+
+
 def load_python_plugin(path: str) -> Dict[Any, Any]:
     """Load a python plugin from a file
 
@@ -107,7 +136,7 @@ def build_cmd_args(cmd_args: List[str]) -> List[str]:
     custom_shell = os.getenv("C8YLP_SHELL")
     out_args = [*cmd_args]
 
-    if platform.system() != "Windows":
+    if not _IS_WINDOWS:
         if not custom_shell:
             # Rely on the script's shebang
             return out_args
@@ -162,13 +191,15 @@ def create_bash_plugin(script_path: str) -> click.Command:
     )
     @click.pass_context
     def bash_wrapper(wctx, additional_args, **kwargs):
+        # Note: start_background already exposes the proxy settings
+        # via environment variables
         proxy = ProxyContext(wctx, kwargs).start_background()
-        proxy.set_env()
 
         plugin_args = build_cmd_args([script_path, *additional_args])
         proxy.show_message(f"Running plugin: {' '.join(plugin_args)}")
         try:
-            exit_code = subprocess.call(plugin_args, env=os.environ)
+            # close_fds=False allows launching via posix_spawn
+            exit_code = subprocess.call(plugin_args, env=os.environ, close_fds=False)
         except Exception as ex:
             proxy.show_error(
                 "Failed to execute plugin. Is the plugin executable and contain a shebang on the first line?. "
@@ -197,12 +228,11 @@ class PluginCLI(click.MultiCommand):
         for plugin_folder in plugin_folders():
             click.echo(f"Checking plugin folder: {plugin_folder}")
             plugin_folder = plugin_folder.expanduser()
-            if plugin_folder.exists():
-                for filename in os.listdir(str(plugin_folder)):
-                    if filename.endswith(".py") and filename != "__init__.py":
-                        cmds.append(filename[:-3])
-                    elif filename.endswith(".sh"):
-                        cmds.append(filename[:-3])
+            try:
+                mtime_ns = plugin_folder.stat().st_mtime_ns
+            except OSError:
+                continue
+            cmds.extend(_scan_plugin_folder(str(plugin_folder), mtime_ns))
 
         cmds.sort()
 
@@ -48,6 +48,10 @@ def wait_for_port(port: int, timeout: float = 30.0, silent: bool = False) -> Non
     """
     start_at = time.monotonic()
     expires_at = start_at + timeout
+
+    # Exponential backoff: poll quickly while the port is about to open,
+    # then back off gracefully (capped) if the startup is slow
+    delay = 0.001
     while True:
         if is_port_open(port):
             duration = time.monotonic() - start_at
@@ -59,7 +63,8 @@ def wait_for_port(port: int, timeout: float = 30.0, silent: bool = False) -> Non
             raise TimeoutError(
                 f"Timed out waiting for port to be opened. port={port}, timeout={timeout}"
             )
-        time.sleep(0.25)
+        time.sleep(delay)
+        delay = min(delay * 2, 0.25)
 
 
 def is_port_open(port: int, host: str = "127.0.0.1") -> bool:
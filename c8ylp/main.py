@@ -17,30 +17,66 @@
 #
 """Main cli interface to c8ylp"""
 
-import click
+import importlib
+from typing import Dict, List, Optional
 
-from .cli.login import login
-from .cli.plugin import cli_plugin
-from .cli.server import server
-from .cli.version import version
-from .cli.connect import commands as connect
+import click
 
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 
 
-@click.group()
-def cli_core():
-    """Main cli entry point"""
+class LazyGroup(click.Group):
+    """Click group which imports subcommand modules on demand.
+
+    Subcommands are declared as "module:attribute" references and only
+    imported when the matching subcommand (or its help) is requested.
+    This keeps short-lived invocations such as `c8ylp version` or
+    `c8ylp --help` from paying the import cost of the requests/websocket
+    dependencies used by the proxy commands.
+    """
+
+    def __init__(self, *args, lazy_subcommands: Dict[str, str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List commands
+
+        Args:
+            ctx (click.Context): Click context
+
+        Returns:
+            List[str]: List of sub command names
+        """
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Get a command via its name, importing the module behind a lazy
+        subcommand on first use.
+
+        Args:
+            ctx (click.Context): Click context
+            cmd_name (str): Name of the command
 
+        Returns:
+            Optional[click.Command]: Resolved command
+        """
+        if cmd_name in self.lazy_subcommands:
+            module_name, _, attr_name = self.lazy_subcommands[cmd_name].partition(":")
+            module = importlib.import_module(module_name)
+            return getattr(module, attr_name)
+        return super().get_command(ctx, cmd_name)
 
-cli_core.add_command(login)
-cli_core.add_command(version)
-cli_core.add_command(server)
-cli_core.add_command(connect.connect)
 
-cli = click.CommandCollection(
+cli = LazyGroup(
     "cli",
-    sources=[cli_core, cli_plugin],
+    lazy_subcommands={
+        "login": "c8ylp.cli.login:login",
+        "server": "c8ylp.cli.server:server",
+        "version": "c8ylp.cli.version:version",
+        "connect": "c8ylp.cli.connect.commands:connect",
+        "plugin": "c8ylp.cli.plugin:run",
+    },
     context_settings=CONTEXT_SETTINGS,
     invoke_without_command=True,
     no_args_is_help=True,
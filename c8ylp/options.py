@@ -26,7 +26,6 @@ import functools
 import click
 
 from c8ylp.env import loadenv
-from c8ylp.rest_client.c8yclient import CumulocityClient
 
 
 def load_envfile(ctx: click.Context, _param: click.Parameter, value: Any):
@@ -92,6 +91,10 @@ def validate_token(ctx: click.Context, _param, value) -> Any:
     if isinstance(value, tuple):
         return value
 
+    # Deferred so importing the options module does not pull in requests
+    # pylint: disable=import-outside-toplevel
+    from c8ylp.rest_client.c8yclient import CumulocityClient
+
     client = CumulocityClient(hostname=host, token=value)
 
     try:
@@ -336,6 +339,16 @@ TCP_TIMEOUT = click.option(
     help="Timeout in sec. for inactivity. Can be activated with values > 0",
 )
 
+WS_BATCH_MS = click.option(
+    "--ws-batch-ms",
+    envvar="C8YLP_WS_BATCH_MS",
+    type=click.FloatRange(0.0, 100.0),
+    default=0.0,
+    show_default=True,
+    show_envvar=True,
+    help="Batching window in ms. to coalesce small writes into fewer websocket frames. 0=disabled",
+)
+
 LOGGING_VERBOSE = click.option(
     "--verbose",
     "-v",
@@ -446,6 +459,7 @@ def common_options(f):
         PING_INTERVAL,
         TCP_SIZE,
         TCP_TIMEOUT,
+        WS_BATCH_MS,
         LOGGING_VERBOSE,
         SSL_IGNORE_VERIFY,
         STORE_TOKEN,
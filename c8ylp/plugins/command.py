@@ -105,7 +105,9 @@ def cli(ctx: click.Context, additional_args: List[str], **kwargs):
 
     proxy.show_message(f"Running custom command: {' '.join(cmd_args)}")
 
-    exit_code = subprocess.call(cmd_args, env=os.environ, shell=False)
+    # close_fds=False keeps the posix_spawn fast path (no fork of the
+    # parent address space). The child inherits no sensitive descriptors.
+    exit_code = subprocess.call(cmd_args, env=os.environ, shell=False, close_fds=False)
     if exit_code != 0:
         proxy.show_error(f"Command exited with a non-zero exit code. code={exit_code}")
     ctx.exit(exit_code)
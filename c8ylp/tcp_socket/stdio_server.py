@@ -45,6 +45,12 @@ class StdioHandler:
         self._reader.close()
         self._writer.close()
 
+    def server_close(self):
+        """Close the server. No-op as there is no listening socket,
+        but keeps the handler interchangeable with the socketserver
+        based servers during proxy shutdown
+        """
+
     def serve_forever(self):
         """stdio "connection" handler"""
         with io.open(
@@ -19,9 +19,11 @@
 
 import errno
 import logging
+import os
 import socket
 import socketserver
 import threading
+import time
 
 
 class TCPHandler(socketserver.BaseRequestHandler):
@@ -31,17 +33,86 @@ class TCPHandler(socketserver.BaseRequestHandler):
     It is instantiated once per connection to the server
     """
 
+    def setup(self):
+        """Tune the accepted socket before the request is handled"""
+        request: socket.socket = self.request
+
+        # Apply the idle timeout as a single kernel-side deadline on the
+        # blocking recv, so an idle connection sleeps in one syscall
+        # instead of waking up periodically to count down
+        request.settimeout(self.server.timeout or None)
+
+        # Interactive tunnels (i.e. ssh keystrokes) suffer from Nagle's
+        # algorithm delaying small packets, so disable it and give the
+        # kernel larger buffers for bulk transfers. Guard on the address
+        # family as this handler is shared with the unix socket server
+        if request.family == socket.AF_INET:
+            request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            try:
+                request.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+                request.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+            except OSError:
+                # Buffer sizing is best effort, limits are platform specific
+                pass
+
+        # Opt-in (Linux only): pin the reader thread to a fixed cpu, derived
+        # from the port so concurrent proxies spread out, to keep the
+        # forwarding buffers hot in one cache hierarchy instead of letting
+        # the scheduler bounce the thread between cores
+        if os.getenv("C8YLP_PIN_CPU") and hasattr(os, "sched_setaffinity"):
+            cpu = (getattr(self.server, "port", None) or 0) % os.cpu_count()
+            try:
+                os.sched_setaffinity(0, {cpu})
+            except OSError as ex:
+                logging.info("Could not pin reader thread to cpu %d. %s", cpu, ex)
+
+    def _drain(self, rx_view: memoryview, length: int, batch_window: float) -> int:
+        """Drain further segments into the receive buffer so a burst of
+        small packets is forwarded as one websocket frame instead of one
+        frame per segment.
+
+        The whole batch shares one deadline so a steady trickle of data
+        cannot extend the wait beyond the configured window.
+
+        Args:
+            rx_view (memoryview): View over the reused receive buffer
+            length (int): Number of bytes already in the buffer
+            batch_window (float): Max. time in seconds to wait for more
+                data. 0 only collects what the kernel has already buffered
+
+        Returns:
+            int: Total number of bytes in the buffer
+        """
+        recv_into = self.request.recv_into
+        settimeout = self.request.settimeout
+        flush_at = time.monotonic() + batch_window if batch_window else None
+        settimeout(0)
+        try:
+            while length < len(rx_view):
+                if flush_at is not None:
+                    remaining = flush_at - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    settimeout(remaining)
+                more = recv_into(rx_view[length:])
+                if not more:
+                    break
+                length += more
+        except (BlockingIOError, socket.timeout):
+            pass
+        finally:
+            settimeout(self.server.timeout or None)
+        return length
+
     def handle(self):
         """Websocket connection handler"""
         request: socket.socket = self.request
 
-        laddr = request.getsockname()
-        raddr = request.getpeername()
         logging.info(
             "Handling request: fd=%s, laddr=%s, raddr=%s",
             request.fileno(),
-            laddr,
-            raddr,
+            request.getsockname(),
+            request.getpeername(),
         )
 
         def handle_shutdown():
@@ -74,11 +145,37 @@ class TCPHandler(socketserver.BaseRequestHandler):
 
         self.server.web_socket_client.proxy_send_message = safe_send
 
+        # Reuse a single receive buffer for the lifetime of the connection
+        # instead of allocating a new bytes object for every recv
+        rx_buffer = bytearray(self.server.buffer_size or 1024)
+        rx_view = memoryview(rx_buffer)
+
+        # Resolve the debug state once; a Logger.debug call still costs a
+        # level check plus argument tuple per packet even when disabled,
+        # and stringifying the payload is expensive even when enabled
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+        # Optional Nagle-like batching: with a window of 0 only segments
+        # the kernel has already buffered are drained, otherwise up to
+        # the window is spent waiting for more data, trading a bounded
+        # amount of latency for fewer and larger websocket frames
+        batch_window = (getattr(self.server, "ws_batch_ms", 0) or 0) / 1000.0
+
+        # Bind the hot attribute chains to locals; inside the loop a
+        # LOAD_FAST replaces several dict lookups per forwarded packet
+        recv_into = request.recv_into
+        send_binary = self.server.web_socket_client.send_binary
+
         while True:
             try:
-                logging.debug("Reading from tcp port")
-                data = request.recv(self.server.buffer_size or 1024)
-                logging.debug("%s wrote: %s", self.client_address, data)
+                length = recv_into(rx_buffer)
+
+                if length:
+                    length = self._drain(rx_view, length, batch_window)
+
+                # websocket-client frames/masks the payload, so hand over an
+                # immutable copy rather than a view into the reused buffer
+                data = rx_view[:length].tobytes()
 
                 if not data:
                     logging.debug("No data. Request will be closed")
@@ -86,9 +183,18 @@ class TCPHandler(socketserver.BaseRequestHandler):
                     self.server.web_socket_client.stop()
                     break
 
-                logging.debug("Writing data to ws: %s", data)
-                self.server.web_socket_client.send_binary(data)
-                logging.debug("Wrote data to ws: %s", data)
+                if debug_enabled:
+                    logging.debug("%s wrote %d bytes", self.client_address, length)
+                send_binary(data)
+                if debug_enabled:
+                    logging.debug("Wrote %d bytes to ws", length)
+            except socket.timeout:
+                logging.info(
+                    "Closing connection after %ss of inactivity", self.server.timeout
+                )
+                self.server.web_socket_client.proxy_send_message = None
+                self.server.web_socket_client.stop()
+                break
             except ConnectionResetError as ex:
                 logging.info("Connection was reset. %s", ex)
                 break
@@ -108,11 +214,13 @@ class CustomTCPServer(socketserver.TCPServer):
         buffer_size: int = 1024,
         tcp_timeout: float = 30,
         port: int = None,
+        ws_batch_ms: float = 0,
     ) -> None:
         self.allow_reuse_address = True
         self.port = port
         self.timeout = tcp_timeout
         self.buffer_size = buffer_size
+        self.ws_batch_ms = ws_batch_ms
         self.web_socket_client = web_socket_client
         super().__init__(
             server_address, RequestHandlerClass, bind_and_activate=bind_and_activate
@@ -128,6 +236,7 @@ class TCPProxyServer:
         web_socket_client,
         tcp_buffer_size,
         tcp_timeout,
+        ws_batch_ms: float = 0,
     ):
         self.web_socket_client = web_socket_client
         self._running = threading.Event()
@@ -136,13 +245,16 @@ class TCPProxyServer:
         # Expose func to web socket client
         self.web_socket_client.proxy = self
 
+        # Use the literal address so bind does not go through name
+        # resolution, which can block if the resolver is misconfigured
         self.server = CustomTCPServer(
             self.web_socket_client,
-            ("localhost", port),
+            ("127.0.0.1", port),
             TCPHandler,
             port=port,
             buffer_size=tcp_buffer_size,
             tcp_timeout=tcp_timeout,
+            ws_batch_ms=ws_batch_ms,
         )
 
     def serve_forever(self):
@@ -164,6 +276,10 @@ class TCPProxyServer:
                 self.server.web_socket_client.shutdown_request()
             self.server.shutdown()
 
+        # Close the listening socket explicitly, otherwise the port stays
+        # bound until the server object happens to be garbage collected
+        self.server.server_close()
+
     def wait_for_running(self, timeout: float = 30.0) -> bool:
         """Wait for the server to startup
 
@@ -39,10 +39,12 @@ class CustomUnixStreamServer(socketserver.UnixStreamServer):
         bind_and_activate=True,
         buffer_size: int = 1024,
         tcp_timeout: float = 30,
+        ws_batch_ms: float = 0,
     ) -> None:
         self.allow_reuse_address = True
         self.timeout = tcp_timeout
         self.buffer_size = buffer_size
+        self.ws_batch_ms = ws_batch_ms
         self.web_socket_client = web_socket_client
         super().__init__(
             server_address, RequestHandlerClass, bind_and_activate=bind_and_activate
@@ -61,6 +63,7 @@ class UnixStreamProxyServer(TCPProxyServer):
         web_socket_client,
         tcp_buffer_size,
         tcp_timeout,
+        ws_batch_ms: float = 0,
     ):
         self.web_socket_client = web_socket_client
         self._running = threading.Event()
@@ -76,6 +79,7 @@ class UnixStreamProxyServer(TCPProxyServer):
             TCPHandler,
             buffer_size=tcp_buffer_size,
             tcp_timeout=tcp_timeout,
+            ws_batch_ms=ws_batch_ms,
         )
 
     def shutdown(self):
@@ -154,10 +154,11 @@ class WebsocketClient(threading.Thread):
         self.logger.debug("websocket options: %s", web_socket_kwargs)
 
         self.wst = threading.Thread(
-            target=self.web_socket.run_forever, kwargs=web_socket_kwargs
+            target=self.web_socket.run_forever,
+            kwargs=web_socket_kwargs,
+            name=f"WSTunnelThread-{self.config_id}",
+            daemon=True,
         )
-        self.wst.daemon = True
-        self.wst.name = f"WSTunnelThread-{self.config_id}"
         self.wst.start()
         return self
 
@@ -176,6 +177,11 @@ class WebsocketClient(threading.Thread):
         Returns:
             bool: True if the websocket is open
         """
+        # Fast path: is_set is a plain flag read, whereas Event.wait
+        # acquires the condition lock even when the event is already set.
+        # This is called for every forwarded packet via send_binary.
+        if self._ws_open_event.is_set():
+            return True
         return self._ws_open_event.wait(timeout=self._ws_timeout)
 
     def is_open(self) -> bool:
@@ -241,6 +247,15 @@ class WebsocketClient(threading.Thread):
         )
         self._ws_open_event.clear()
 
+        # Shut down the local socket so a reader blocked in recv returns
+        # immediately, instead of lingering until the local client sends
+        # more data or its idle timeout expires
+        if callable(self.shutdown_request):
+            try:
+                self.shutdown_request()
+            except OSError as ex:
+                self.logger.debug("Ignoring shutdown request error: %s", ex)
+
     def _on_ws_open(self, _ws):
         self.logger.info("WebSocket Connection opened")
         self._ws_open_event.set()
@@ -0,0 +1,80 @@
+#
+# Copyright (c) 2021 Software AG, Darmstadt, Germany and/or its licensors
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Core cli tests"""
+
+import logging
+import pathlib
+
+import click
+
+from c8ylp.cli.core import LazyRotatingFileHandler, ProxyContext
+
+
+def create_record(message: str) -> logging.LogRecord:
+    """Create a log record with the given message"""
+    return logging.LogRecord(
+        "test", logging.INFO, __file__, 1, message, None, None
+    )
+
+
+def test_lazy_handler_defers_opening_the_log_file(tmp_path: pathlib.Path):
+    """Test that neither the log folder nor the file are created before
+    the first record is emitted"""
+    log_file = tmp_path / "logs" / "c8ylp.log"
+    handler = LazyRotatingFileHandler(str(log_file), maxBytes=1000, backupCount=1)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    assert not log_file.parent.exists()
+
+    handler.emit(create_record("hello log"))
+    handler.close()
+
+    assert log_file.read_text(encoding="utf8").strip() == "hello log"
+
+
+def test_lazy_handler_close_without_emit(tmp_path: pathlib.Path):
+    """Test that closing a handler which never logged does not create the file"""
+    log_file = tmp_path / "logs" / "c8ylp.log"
+    handler = LazyRotatingFileHandler(str(log_file), maxBytes=1000, backupCount=1)
+    handler.close()
+
+    assert not log_file.exists()
+
+
+def create_proxy_context() -> ProxyContext:
+    """Create a proxy context without any options applied"""
+    return ProxyContext(click.Context(click.Command("dummy")))
+
+
+def test_fromdict_sets_known_fields():
+    """Test that known options are applied to the context"""
+    proxy = create_proxy_context()
+    proxy.fromdict({"host": "https://example.c8y.io", "port": 1234})
+
+    assert proxy.host == "https://example.c8y.io"
+    assert proxy.port == 1234
+
+
+def test_fromdict_ignores_unknown_keys():
+    """Test that unknown keys are filtered out instead of being set
+    as attributes on the context"""
+    proxy = create_proxy_context()
+    proxy.fromdict({"device": "device01", "no_such_option": True})
+
+    assert proxy.device == "device01"
+    assert not hasattr(proxy, "no_such_option")
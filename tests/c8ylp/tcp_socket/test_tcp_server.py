@@ -0,0 +1,140 @@
+#
+# Copyright (c) 2021 Software AG, Darmstadt, Germany and/or its licensors
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""TCP server tests"""
+
+import socket
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from c8ylp.tcp_socket.tcp_server import TCPHandler, TCPProxyServer
+
+# pylint: disable=protected-access
+
+
+def create_proxy_server(tcp_timeout: float = 0, ws_batch_ms: float = 0) -> TCPProxyServer:
+    """Create a proxy server on a random port with a mocked websocket client"""
+    web_socket_client = MagicMock()
+    web_socket_client.is_open.return_value = True
+    return TCPProxyServer(0, web_socket_client, 1024, tcp_timeout, ws_batch_ms)
+
+
+def test_idle_timeout_stops_websocket():
+    """Test that an idle connection tears down the websocket tunnel the
+    same way a client disconnect does"""
+    server = create_proxy_server(tcp_timeout=0.5)
+    web_socket_client = server.web_socket_client
+    background = threading.Thread(target=server.serve_forever, daemon=True)
+    background.start()
+
+    try:
+        assert server.wait_for_running(5)
+        port = server.server.socket.getsockname()[1]
+
+        with socket.create_connection(("127.0.0.1", port)) as sock:
+            sock.sendall(b"hello")
+
+            # Wait (with margin) for the idle timeout to kick in
+            for _ in range(100):
+                if web_socket_client.stop.called:
+                    break
+                time.sleep(0.1)
+
+        web_socket_client.send_binary.assert_called_with(b"hello")
+        assert web_socket_client.stop.called
+        assert web_socket_client.proxy_send_message is None
+    finally:
+        server.shutdown()
+        background.join(timeout=5)
+
+
+def test_ws_batch_ms_is_passed_to_the_server():
+    """Test that the batching window option reaches the underlying server"""
+    server = create_proxy_server(tcp_timeout=30, ws_batch_ms=5)
+    try:
+        assert server.server.ws_batch_ms == 5
+    finally:
+        server.server.server_close()
+
+
+def create_handler(sock: socket.socket) -> TCPHandler:
+    """Create a detached handler around the given socket for testing
+    individual methods without running a server"""
+    handler = TCPHandler.__new__(TCPHandler)
+    handler.request = sock
+    handler.server = SimpleNamespace(timeout=10)
+    return handler
+
+
+def test_drain_collects_buffered_segments():
+    """Test that segments already buffered by the kernel are drained
+    into one payload without a batching window"""
+    local, remote = socket.socketpair()
+    try:
+        handler = create_handler(local)
+        buffer = bytearray(1024)
+        view = memoryview(buffer)
+
+        remote.sendall(b"first")
+        length = local.recv_into(buffer)
+
+        remote.sendall(b"second")
+        time.sleep(0.2)
+        length = handler._drain(view, length, 0)
+
+        assert bytes(view[:length]) == b"firstsecond"
+    finally:
+        local.close()
+        remote.close()
+
+
+def test_drain_batch_window_is_a_total_deadline():
+    """Test that a steady trickle of data cannot extend the batch
+    beyond the configured window"""
+    local, remote = socket.socketpair()
+    stop = threading.Event()
+
+    def trickle():
+        while not stop.is_set():
+            remote.sendall(b"x" * 10)
+            time.sleep(0.02)
+
+    writer = threading.Thread(target=trickle, daemon=True)
+    try:
+        handler = create_handler(local)
+        buffer = bytearray(64 * 1024)
+        view = memoryview(buffer)
+
+        remote.sendall(b"x" * 10)
+        length = local.recv_into(buffer)
+        writer.start()
+
+        start = time.monotonic()
+        length = handler._drain(view, length, 0.2)
+        elapsed = time.monotonic() - start
+
+        # Data arrives faster than the window, so only the shared
+        # deadline stops the batch (well before the buffer is full)
+        assert elapsed < 1.0
+        assert 0 < length < len(buffer)
+    finally:
+        stop.set()
+        writer.join(timeout=5)
+        local.close()
+        remote.close()
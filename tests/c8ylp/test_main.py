@@ -0,0 +1,47 @@
+#
+# Copyright (c) 2021 Software AG, Darmstadt, Germany and/or its licensors
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Main cli tests"""
+
+import click
+
+from c8ylp.main import cli
+
+
+def test_list_commands_includes_lazy_subcommands():
+    """Test that all lazy subcommands are listed (sorted) without resolving them"""
+    ctx = click.Context(cli)
+    commands = cli.list_commands(ctx)
+
+    assert commands == sorted(commands)
+    for name in ["connect", "login", "plugin", "server", "version"]:
+        assert name in commands
+
+
+def test_get_command_resolves_lazy_subcommand():
+    """Test that a lazy subcommand resolves to a click command on first use"""
+    ctx = click.Context(cli)
+    command = cli.get_command(ctx, "version")
+
+    assert isinstance(command, click.Command)
+    assert command.name == "version"
+
+
+def test_get_command_unknown_command():
+    """Test that an unknown command is not resolved"""
+    ctx = click.Context(cli)
+    assert cli.get_command(ctx, "does-not-exist") is None
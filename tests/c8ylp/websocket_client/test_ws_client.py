@@ -0,0 +1,63 @@
+#
+# Copyright (c) 2021 Software AG, Darmstadt, Germany and/or its licensors
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Websocket client tests"""
+
+from unittest.mock import MagicMock
+
+import websocket
+
+from c8ylp.websocket_client.ws_client import WebsocketClient
+
+# pylint: disable=protected-access
+
+
+def create_client(**kwargs) -> WebsocketClient:
+    """Create a websocket client without connecting it"""
+    return WebsocketClient(
+        host="https://example.c8y.io",
+        config_id="12345",
+        device_id="67890",
+        session=None,
+        token="dummy",
+        **kwargs,
+    )
+
+
+def test_close_triggers_shutdown_request():
+    """Test that closing the websocket unblocks the local socket reader"""
+    shutdown_request = MagicMock()
+    client = create_client(shutdown_request=shutdown_request)
+    client._on_ws_open(None)
+    assert client.is_open()
+
+    client._on_ws_close(None, websocket.STATUS_NORMAL, None)
+
+    assert shutdown_request.called
+    assert not client.is_open()
+
+
+def test_close_ignores_shutdown_request_errors():
+    """Test that an error whilst shutting down an already closed socket
+    is ignored"""
+    shutdown_request = MagicMock(side_effect=OSError("already closed"))
+    client = create_client(shutdown_request=shutdown_request)
+
+    client._on_ws_close(None, websocket.STATUS_GOING_AWAY, "going away")
+
+    assert shutdown_request.called
+    assert not client.is_open()